@@ -17,7 +17,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import CONF_ADS_VAR, DATA_ADS, STATE_KEY_STATE
+from .const import CONF_ADS_VAR, DATA_ADS
 from .entity import AdsEntity
 from .hub import AdsHub
 
@@ -69,4 +69,4 @@ class AdsBinarySensor(AdsEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return True if the entity is on."""
-        return self._state_dict[STATE_KEY_STATE]
+        return self._state
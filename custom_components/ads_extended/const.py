@@ -5,6 +5,8 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+import voluptuous as vol
+
 from homeassistant.util.hass_dict import HassKey
 
 if TYPE_CHECKING:
@@ -16,7 +18,13 @@ DATA_ADS: HassKey[AdsHub] = HassKey(DOMAIN)
 
 CONF_ADS_VAR = "adsvar"
 
-STATE_KEY_STATE = "state"
+# Unlike cv.string, non-string (e.g. numeric) and empty variable names are
+# rejected on purpose instead of being coerced
+ADS_VAR_SCHEMA = vol.All(str, vol.Length(min=1))
+
+# State keys name the entity attributes that hold notified values
+STATE_KEY_STATE = "_state"
+STATE_KEY_IS_ON = "_attr_is_on"
 
 
 class AdsType(StrEnum):
@@ -33,7 +33,7 @@ CONF_ADS_VAR_CLOSE = "adsvar_close"
 CONF_ADS_VAR_STOP = "adsvar_stop"
 CONF_ADS_VAR_POSITION = "adsvar_position"
 
-STATE_KEY_POSITION = "position"
+STATE_KEY_POSITION = "_position"
 
 PLATFORM_SCHEMA = COVER_PLATFORM_SCHEMA.extend(
     {
@@ -87,6 +87,8 @@ def setup_platform(
 class AdsCover(AdsEntity, CoverEntity):
     """Representation of ADS cover."""
 
+    _state_keys = frozenset({STATE_KEY_STATE, STATE_KEY_POSITION})
+
     def __init__(
         self,
         ads_hub: AdsHub,
@@ -109,7 +111,7 @@ class AdsCover(AdsEntity, CoverEntity):
             elif ads_var_open is not None:
                 self._attr_unique_id = ads_var_open
 
-        self._state_dict[STATE_KEY_POSITION] = None
+        self._position: int | None = None
         self._ads_var_position = ads_var_position
         self._ads_var_pos_set = ads_var_pos_set
         self._ads_var_open = ads_var_open
@@ -138,15 +140,15 @@ class AdsCover(AdsEntity, CoverEntity):
     def is_closed(self) -> bool | None:
         """Return if the cover is closed."""
         if self._ads_var is not None:
-            return self._state_dict[STATE_KEY_STATE]
+            return self._state
         if self._ads_var_position is not None:
-            return self._state_dict[STATE_KEY_POSITION] == 0
+            return self._position == 0
         return None
 
     @property
     def current_cover_position(self) -> int:
         """Return current position of cover."""
-        return self._state_dict[STATE_KEY_POSITION]
+        return self._position
 
     def stop_cover(self, **kwargs: Any) -> None:
         """Fire the stop action."""
@@ -179,8 +181,5 @@ class AdsCover(AdsEntity, CoverEntity):
     def available(self) -> bool:
         """Return False if state has not been updated yet."""
         if self._ads_var is not None or self._ads_var_position is not None:
-            return (
-                self._state_dict[STATE_KEY_STATE] is not None
-                or self._state_dict[STATE_KEY_POSITION] is not None
-            )
+            return self._state is not None or self._position is not None
         return True
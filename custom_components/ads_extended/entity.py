@@ -2,8 +2,9 @@
 
 import asyncio
 from asyncio import timeout
+from collections.abc import Callable
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 from homeassistant.helpers.entity import Entity
 
@@ -17,14 +18,17 @@ class AdsEntity(Entity):
     """Representation of ADS entity."""
 
     _attr_should_poll = False
+    # State keys this entity accepts from device notifications
+    _state_keys: ClassVar[frozenset[str]] = frozenset({STATE_KEY_STATE})
+    # State key that holds the primary state, the entity is unavailable until
+    # it has been notified
+    _state_key_available: ClassVar[str] = STATE_KEY_STATE
 
     def __init__(self, ads_hub: AdsHub, name: str, ads_var: str) -> None:
         """Initialize ADS binary sensor."""
-        self._state_dict: dict[str, Any] = {}
-        self._state_dict[STATE_KEY_STATE] = None
+        setattr(self, self._state_key_available, None)
         self._ads_hub = ads_hub
         self._ads_var = ads_var
-        self._event: asyncio.Event | None = None
         self._attr_unique_id = ads_var
         self._attr_name = name
 
@@ -34,37 +38,52 @@ class AdsEntity(Entity):
         plctype: type,
         state_key: str = STATE_KEY_STATE,
         factor: int | None = None,
+        converter: Callable[[Any], Any] | None = None,
     ) -> None:
         """Register device notification."""
+        if state_key not in self._state_keys:
+            raise ValueError(
+                f"State key {state_key} is not declared by {type(self).__name__}"
+            )
 
         def update(name, value):
             """Handle device notifications."""
             _LOGGER.debug("Variable %s changed its value to %s", name, value)
 
-            if factor is None:
-                self._state_dict[state_key] = value
-            else:
-                self._state_dict[state_key] = value / factor
+            if converter is not None:
+                value = converter(value)
+            elif factor is not None:
+                value = value / factor
+
+            setattr(self, state_key, value)
 
             asyncio.run_coroutine_threadsafe(async_event_set(), self.hass.loop)
             self.schedule_update_ha_state()
 
         async def async_event_set():
             """Set event in async context."""
-            self._event.set()
+            event.set()
 
-        self._event = asyncio.Event()
+        # One event per registration so concurrent registrations don't clash
+        event = asyncio.Event()
 
-        await self.hass.async_add_executor_job(
-            self._ads_hub.add_device_notification, ads_var, plctype, update
+        await self._ads_hub.async_add_device_notification(
+            self.hass, ads_var, plctype, update
         )
         try:
             async with timeout(10):
-                await self._event.wait()
+                await event.wait()
         except TimeoutError:
             _LOGGER.debug("Variable %s: Timeout during first update", ads_var)
 
+    async def async_initialize_devices(self, specs: list[tuple[Any, ...]]) -> None:
+        """Register several device notifications concurrently.
+
+        Each spec holds the positional arguments of async_initialize_device.
+        """
+        await asyncio.gather(*(self.async_initialize_device(*spec) for spec in specs))
+
     @property
     def available(self) -> bool:
         """Return False if state has not been updated yet."""
-        return self._state_dict[STATE_KEY_STATE] is not None
+        return getattr(self, self._state_key_available) is not None
@@ -7,6 +7,7 @@ import struct
 import threading
 
 import pyads
+from pyads.constants import ADSIGRP_SYM_VALBYHND
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ class AdsHub:
         # All ADS devices are registered here
         self._devices = []
         self._notification_items = {}
+        self._handles = {}
+        # Notifications queued by entities, added together by one executor job
+        self._pending_registrations = []
         self._lock = threading.Lock()
 
     def shutdown(self, *args, **kwargs):
@@ -45,6 +49,12 @@ class AdsHub:
                 )
             except pyads.ADSError as err:
                 _LOGGER.error(err)
+        for name, handle in self._handles.items():
+            _LOGGER.debug("Releasing handle %d for variable %s", handle, name)
+            try:
+                self._client.release_handle(handle)
+            except pyads.ADSError as err:
+                _LOGGER.error(err)
         try:
             self._client.close()
         except pyads.ADSError as err:
@@ -63,6 +73,91 @@ class AdsHub:
             except pyads.ADSError as err:
                 _LOGGER.error("Error writing %s: %s", name, err)
 
+    def _get_handle(self, name):
+        """Return the cached handle of a variable, acquiring it if needed.
+
+        Must be called with the lock held.
+        """
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = self._client.get_handle(name)
+            if handle is not None:
+                self._handles[name] = handle
+        return handle
+
+    def get_handle(self, name):
+        """Get a handle to a variable, cached until shutdown."""
+
+        with self._lock:
+            try:
+                return self._get_handle(name)
+            except pyads.ADSError as err:
+                _LOGGER.error("Error getting handle for %s: %s", name, err)
+                return None
+
+    def write_by_handle(self, name, value, plc_datatype):
+        """Write a value to the device through the variable's cached handle.
+
+        The handle is acquired on first use. Without a handle, or when the
+        handle has gone stale, the value is written by name instead.
+        """
+
+        with self._lock:
+            try:
+                handle = self._get_handle(name)
+                if handle is None:
+                    return self._client.write_by_name(name, value, plc_datatype)
+                # Write the symbol value by handle directly, bypassing pyads'
+                # by-name path
+                return self._client.write(
+                    ADSIGRP_SYM_VALBYHND, handle, value, plc_datatype
+                )
+            except pyads.ADSError:
+                # Handles become invalid e.g. after a PLC program download,
+                # retry by name and acquire a new one on the next write
+                self._handles.pop(name, None)
+                try:
+                    return self._client.write_by_name(name, value, plc_datatype)
+                except pyads.ADSError as err:
+                    _LOGGER.error("Error writing %s: %s", name, err)
+
+    def write_list_by_name(self, data_names_and_values):
+        """Write several values to the device in a single sum request.
+
+        Expects a mapping of variable name to a (value, plc_datatype) tuple.
+        """
+
+        values = {}
+        structure_defs = {}
+        for name, (value, plc_datatype) in data_names_and_values.items():
+            if isinstance(plc_datatype, type) and issubclass(
+                plc_datatype, ctypes.Array
+            ):
+                # Sum writes pack scalars only, arrays go in as one-field structures
+                structure_defs[name] = (
+                    (name, plc_datatype._type_, plc_datatype._length_),
+                )
+                values[name] = {name: list(value)}
+            else:
+                values[name] = value
+
+        with self._lock:
+            try:
+                # Symbol locations move on a PLC program download, look them up
+                # on every write rather than writing to a stale cached offset
+                results = self._client.write_list_by_name(
+                    values,
+                    cache_symbol_info=False,
+                    structure_defs=structure_defs or None,
+                )
+            except pyads.ADSError as err:
+                _LOGGER.error("Error writing %s: %s", ", ".join(values), err)
+                return
+
+        for name, result in results.items():
+            if result != "no error":
+                _LOGGER.error("Error writing %s: %s", name, result)
+
     def read_by_name(self, name, plc_datatype):
         """Read a value from the device."""
 
@@ -94,6 +189,48 @@ class AdsHub:
                     "Added device notification %d for variable %s", hnotify, name
                 )
 
+    async def async_add_device_notification(self, hass, name, plc_datatype, callback):
+        """Queue a notification and wait until it has been added."""
+
+        future = hass.loop.create_future()
+        self._pending_registrations.append((name, plc_datatype, callback, future))
+        if len(self._pending_registrations) == 1:
+            # Runs after the current loop iteration, so concurrently added
+            # entities end up in the same batch
+            hass.async_create_task(
+                self.async_flush_registrations(hass), eager_start=False
+            )
+        await future
+
+    async def async_flush_registrations(self, hass):
+        """Add all queued notifications in a single executor job."""
+
+        pending, self._pending_registrations = self._pending_registrations, []
+        if not pending:
+            return
+
+        _LOGGER.debug("Adding %d queued device notifications", len(pending))
+        notifications = [item[:3] for item in pending]
+        try:
+            await hass.async_add_executor_job(
+                self.add_device_notifications, notifications
+            )
+        except Exception as err:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for *_, future in pending:
+            if not future.done():
+                future.set_result(None)
+
+    def add_device_notifications(self, notifications):
+        """Add several (name, plc_datatype, callback) notifications."""
+
+        for name, plc_datatype, callback in notifications:
+            self.add_device_notification(name, plc_datatype, callback)
+
     def _device_notification_callback(self, notification, name):
         """Handle device notifications."""
         contents = notification.contents
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
+from datetime import datetime
 from typing import Any
 import logging
 
 import pyads
-from pyads.constants import PLCTYPE_ARR_UINT
 import voluptuous as vol
 
 from homeassistant.components.light import (
@@ -17,32 +19,78 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import CONF_ADS_VAR, DATA_ADS, STATE_KEY_STATE
+from .const import ADS_VAR_SCHEMA, CONF_ADS_VAR, DATA_ADS, STATE_KEY_IS_ON
 from .entity import AdsEntity
 from .hub import AdsHub
 
 CONF_ADS_VAR_BRIGHTNESS = "adsvar_brightness"
 CONF_ADS_VAR_RGBW_COLOR = "adsvar_rgbw_color"
-STATE_KEY_BRIGHTNESS = "brightness"
-STATE_KEY_RGBW_COLOR = "rgbw_color"
+# Notified brightness goes straight into the attribute LightEntity reads
+STATE_KEY_BRIGHTNESS = "_attr_brightness"
+STATE_KEY_RGBW_COLOR = "_attr_rgbw_color"
+
+# ARRAY [0..3] OF UINT, same type as pyads' PLCTYPE_ARR_UINT(4)
+_RGBW_ARR_TYPE = ctypes.c_uint16 * 4
+
+_SUPPORTED_RGBW = frozenset({ColorMode.RGBW})
+_SUPPORTED_BRIGHTNESS = frozenset({ColorMode.BRIGHTNESS})
+_SUPPORTED_ONOFF = frozenset({ColorMode.ONOFF})
+
+# Minimum interval in seconds between turn_on writes, a dragged slider calls
+# turn_on every 100-200 ms and only its latest values are written per window
+WRITE_THROTTLE = 0.2
 
 DEFAULT_NAME = "ADS Light"
 PLATFORM_SCHEMA = LIGHT_PLATFORM_SCHEMA.extend(
     {
-        vol.Required(CONF_ADS_VAR): cv.string,
-        vol.Optional(CONF_ADS_VAR_BRIGHTNESS): cv.string,
-        vol.Optional(CONF_ADS_VAR_RGBW_COLOR): cv.string,
+        vol.Required(CONF_ADS_VAR): ADS_VAR_SCHEMA,
+        vol.Optional(CONF_ADS_VAR_BRIGHTNESS): ADS_VAR_SCHEMA,
+        vol.Optional(CONF_ADS_VAR_RGBW_COLOR): ADS_VAR_SCHEMA,
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
     }
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _clamp_u8(v: int) -> int:
+    """Clamp a value to 0..255."""
+    return 0 if v < 0 else (255 if v > 255 else v)
+
+
+def _normalize_rgbw(rgbw: tuple[int, ...]) -> tuple[int, int, int, int] | None:
+    """Convert a notified RGBW value to a tuple of four 0..255 integers."""
+    # The hub unpacks UINT arrays into tuples of ints, only a failed unpack
+    # falls back to raw bytes of a different length
+    if len(rgbw) != 4:
+        if _LOGGER.isEnabledFor(logging.WARNING):
+            _LOGGER.warning(
+                "Unexpected rgbw_color value (expected 4 values): %s", rgbw
+            )
+        return None
+
+    r, g, b, w = rgbw
+
+    # Any bit above the low byte (including the sign) means out of range
+    if not (r | g | b | w) & ~0xFF:
+        return (r, g, b, w)
+
+    if _LOGGER.isEnabledFor(logging.WARNING):
+        _LOGGER.warning(
+            "rgbw_color values out of range 0-255: R=%d, G=%d, B=%d, W=%d",
+            r, g, b, w
+        )
+
+    # Clamp to 0..255 to satisfy HA expectations
+    return (_clamp_u8(r), _clamp_u8(g), _clamp_u8(b), _clamp_u8(w))
+
+
 def setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
@@ -57,10 +105,33 @@ def setup_platform(
     ads_var_rgbw_color: str | None = config.get(CONF_ADS_VAR_RGBW_COLOR)
     name: str = config[CONF_NAME]
 
-    add_entities([AdsLight(ads_hub, ads_var_enable, ads_var_brightness, ads_var_rgbw_color, name)])
+    # The color mode is fixed by the configuration, pick a specialized entity
+    light_class: type[AdsLight]
+    if ads_var_rgbw_color is not None and ads_var_brightness is not None:
+        light_class = AdsRgbwBrightnessLight
+    elif ads_var_rgbw_color is not None:
+        light_class = AdsRgbwLight
+    elif ads_var_brightness is not None:
+        light_class = AdsBrightnessLight
+    else:
+        light_class = AdsLight
+
+    add_entities(
+        [
+            light_class(
+                ads_hub, ads_var_enable, ads_var_brightness, ads_var_rgbw_color, name
+            )
+        ]
+    )
+
 
 class AdsLight(AdsEntity, LightEntity):
-    """Representation of ADS light."""
+    """Representation of an on/off ADS light."""
+
+    _attr_color_mode = ColorMode.ONOFF
+    _attr_supported_color_modes = _SUPPORTED_ONOFF
+    _state_keys = frozenset({STATE_KEY_IS_ON})
+    _state_key_available = STATE_KEY_IS_ON
 
     def __init__(
         self,
@@ -72,103 +143,190 @@ class AdsLight(AdsEntity, LightEntity):
     ) -> None:
         """Initialize AdsLight entity."""
         super().__init__(ads_hub, name, ads_var_enable)
-        self._state_dict[STATE_KEY_BRIGHTNESS] = None
-        self._state_dict[STATE_KEY_RGBW_COLOR] = None
         self._ads_var_brightness = ads_var_brightness
         self._ads_var_rgbw_color = ads_var_rgbw_color
-        if ads_var_rgbw_color is not None:
-            self._attr_color_mode = ColorMode.RGBW
-            self._attr_supported_color_modes = {ColorMode.RGBW}
-        elif ads_var_brightness is not None:
-            self._attr_color_mode = ColorMode.BRIGHTNESS
-            self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
-        else:
-            self._attr_color_mode = ColorMode.ONOFF
-            self._attr_supported_color_modes = {ColorMode.ONOFF}
+
+    def _notification_specs(self) -> list[tuple[Any, ...]]:
+        """Return the async_initialize_device arguments for each variable."""
+        return [(self._ads_var, pyads.PLCTYPE_BOOL, STATE_KEY_IS_ON)]
+
+    def _value_writes(self, kwargs: dict[str, Any]) -> dict[str, tuple[Any, type]]:
+        """Return the writes for the brightness and color values in kwargs."""
+        return {}
 
     async def async_added_to_hass(self) -> None:
         """Register device notification."""
-        await self.async_initialize_device(self._ads_var, pyads.PLCTYPE_BOOL)
+        specs = self._notification_specs()
+        await self.async_initialize_devices(specs)
 
-        if self._ads_var_brightness is not None:
-            await self.async_initialize_device(
-                self._ads_var_brightness,
-                pyads.PLCTYPE_UINT,
-                STATE_KEY_BRIGHTNESS,
-            )
+        # Every notified variable is also written, warm up the hub's handle cache
+        for ads_var, *_ in specs:
+            await self.hass.async_add_executor_job(self._ads_hub.get_handle, ads_var)
 
-        if self._ads_var_rgbw_color is not None:
-            await self.async_initialize_device(
-                self._ads_var_rgbw_color,
-                PLCTYPE_ARR_UINT(4),
-                STATE_KEY_RGBW_COLOR,
+    async def _async_write(self, writes: dict[str, tuple[Any, type]]) -> None:
+        """Write (value, plc_datatype) pairs keyed by variable name to the PLC."""
+        if not writes:
+            return
+
+        if len(writes) == 1:
+            # A single value is written through its cached handle
+            ((ads_var, (value, plc_datatype)),) = writes.items()
+            await self.hass.async_add_executor_job(
+                self._ads_hub.write_by_handle, ads_var, value, plc_datatype
             )
+            return
 
+        # Write all values to PLC in a single sum request
+        await self.hass.async_add_executor_job(
+            self._ads_hub.write_list_by_name, writes
+        )
 
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light (0..255)."""
-        return self._state_dict[STATE_KEY_BRIGHTNESS]
-
-    @property
-    def rgbw_color(self) -> tuple[int, int, int, int] | None:
-        """Return (R, G, B, W)."""
-        rgbw = self._state_dict[STATE_KEY_RGBW_COLOR]
-        if rgbw is None:
-            return None
-
-        # Expect a list/tuple of four 0..255 integers from hub; warn otherwise
-        if isinstance(rgbw, (tuple, list)) and len(rgbw) == 4:
-            try:
-                r, g, b, w = (int(rgbw[0]), int(rgbw[1]), int(rgbw[2]), int(rgbw[3]))
-            except (ValueError, TypeError):
-                _LOGGER.warning("rgbw_color has non-integer values: %s", rgbw)
-                return None
-
-            # Clamp to 0..255 to satisfy HA expectations
-            if not all(0 <= v <= 255 for v in [r, g, b, w]):
-                _LOGGER.warning(
-                    "rgbw_color values out of range 0-255: R=%d, G=%d, B=%d, W=%d",
-                    r, g, b, w
-                )
-            def clamp(v: int) -> int:
-                return max(0, min(255, v))
-
-            return (clamp(r), clamp(g), clamp(b), clamp(w))
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on."""
+        await self._async_turn_on(**kwargs)
 
-        _LOGGER.warning(
-            "Unexpected rgbw_color value (expected tuple/list of 4): %s", type(rgbw)
+    async def _async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on and set the given dimmer or color values."""
+        writes = self._value_writes(kwargs)
+
+        # Value changes usually arrive while the light is on, a bare turn_on
+        # is always written since the notified state may be stale
+        if not writes or not self.is_on:
+            writes = {self._ads_var: (True, pyads.PLCTYPE_BOOL), **writes}
+
+        await self._async_write(writes)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the light off."""
+        await self.hass.async_add_executor_job(
+            self._ads_hub.write_by_handle,
+            self._ads_var,
+            False,
+            pyads.PLCTYPE_BOOL,
         )
-        return None
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the entity is on."""
-        return self._state_dict[STATE_KEY_STATE]
 
-    def turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on and set a specific dimmer or color value."""
-        self._ads_hub.write_by_name(self._ads_var, True, pyads.PLCTYPE_BOOL)
+class _AdsThrottledLight(AdsLight):
+    """ADS light that writes rapid turn_on calls at most once per window."""
 
-        brightness = kwargs.get(ATTR_BRIGHTNESS)
-        if self._ads_var_brightness is not None and brightness is not None:
-            self._ads_hub.write_by_name(
-                self._ads_var_brightness, brightness, pyads.PLCTYPE_UINT
-            )
+    def __init__(
+        self,
+        ads_hub: AdsHub,
+        ads_var_enable: str,
+        ads_var_brightness: str | None,
+        ads_var_rgbw_color: str | None,
+        name: str,
+    ) -> None:
+        """Initialize _AdsThrottledLight entity."""
+        super().__init__(
+            ads_hub, ads_var_enable, ads_var_brightness, ads_var_rgbw_color, name
+        )
+        # Values merged from turn_on calls held back until the window ends
+        self._pending_kwargs: dict[str, Any] | None = None
+        self._cancel_pending_write: CALLBACK_TYPE | None = None
+        # The hub's lock is not FIFO, writes queue here so the latest lands last
+        self._write_lock = asyncio.Lock()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending write."""
+        self._cancel_write()
 
-        rgbw_color = kwargs.get(ATTR_RGBW_COLOR)
-        if self._ads_var_rgbw_color is not None and rgbw_color is not None:
-            if len(rgbw_color) == 4:
-                # Create c_uint16 array of length 4
-                arr_type = PLCTYPE_ARR_UINT(4)
-                arr = arr_type(*rgbw_color)
+    def _cancel_write(self) -> None:
+        """Close the throttle window and forget held back values."""
+        if self._cancel_pending_write is not None:
+            self._cancel_pending_write()
+            self._cancel_pending_write = None
+        self._pending_kwargs = None
 
-                # Write to PLC
-                self._ads_hub.write_by_name(
-                    self._ads_var_rgbw_color, arr, arr_type
-                )
+    def _start_window(self) -> None:
+        """Hold back further turn_on writes for one throttle window."""
+        self._cancel_pending_write = async_call_later(
+            self.hass, WRITE_THROTTLE, self._async_flush_write
+        )
 
+    async def _async_flush_write(self, _now: datetime) -> None:
+        """Write the values held back during the window, if any."""
+        self._cancel_pending_write = None
+        if self._pending_kwargs is None:
+            return
 
-    def turn_off(self, **kwargs: Any) -> None:
-        """Turn the light off."""
-        self._ads_hub.write_by_name(self._ads_var, False, pyads.PLCTYPE_BOOL)
+        kwargs, self._pending_kwargs = self._pending_kwargs, None
+        # Keep throttling while calls keep arriving
+        self._start_window()
+        async with self._write_lock:
+            await self._async_turn_on(**kwargs)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on, writing at most once per throttle window."""
+        if self._cancel_pending_write is not None:
+            self._pending_kwargs = {**(self._pending_kwargs or {}), **kwargs}
+            return
+
+        self._start_window()
+        async with self._write_lock:
+            await self._async_turn_on(**kwargs)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the light off, dropping held back turn_on values."""
+        self._cancel_write()
+        async with self._write_lock:
+            await super().async_turn_off(**kwargs)
+
+
+class AdsBrightnessLight(_AdsThrottledLight):
+    """Representation of a dimmable ADS light."""
+
+    _attr_color_mode = ColorMode.BRIGHTNESS
+    _attr_supported_color_modes = _SUPPORTED_BRIGHTNESS
+    _state_keys = AdsLight._state_keys | {STATE_KEY_BRIGHTNESS}
+    _ads_var_brightness: str
+
+    def _notification_specs(self) -> list[tuple[Any, ...]]:
+        """Return the async_initialize_device arguments for each variable."""
+        return [
+            *super()._notification_specs(),
+            (self._ads_var_brightness, pyads.PLCTYPE_UINT, STATE_KEY_BRIGHTNESS),
+        ]
+
+    def _value_writes(self, kwargs: dict[str, Any]) -> dict[str, tuple[Any, type]]:
+        """Return the writes for the brightness and color values in kwargs."""
+        writes = super()._value_writes(kwargs)
+        if (brightness := kwargs.get(ATTR_BRIGHTNESS)) is not None:
+            writes[self._ads_var_brightness] = (brightness, pyads.PLCTYPE_UINT)
+        return writes
+
+
+class AdsRgbwLight(_AdsThrottledLight):
+    """Representation of an RGBW ADS light without a dimmer."""
+
+    _attr_color_mode = ColorMode.RGBW
+    _attr_supported_color_modes = _SUPPORTED_RGBW
+    _state_keys = AdsLight._state_keys | {STATE_KEY_RGBW_COLOR}
+    _ads_var_rgbw_color: str
+
+    def _notification_specs(self) -> list[tuple[Any, ...]]:
+        """Return the async_initialize_device arguments for each variable."""
+        return [
+            *super()._notification_specs(),
+            (
+                self._ads_var_rgbw_color,
+                _RGBW_ARR_TYPE,
+                STATE_KEY_RGBW_COLOR,
+                None,
+                _normalize_rgbw,
+            ),
+        ]
+
+    def _value_writes(self, kwargs: dict[str, Any]) -> dict[str, tuple[Any, type]]:
+        """Return the writes for the brightness and color values in kwargs."""
+        writes = super()._value_writes(kwargs)
+        if (rgbw_color := kwargs.get(ATTR_RGBW_COLOR)) is not None:
+            arr = _RGBW_ARR_TYPE(*rgbw_color)
+            writes[self._ads_var_rgbw_color] = (arr, _RGBW_ARR_TYPE)
+        return writes
+
+
+class AdsRgbwBrightnessLight(AdsRgbwLight, AdsBrightnessLight):
+    """Representation of an RGBW ADS light with a dimmer."""
+
+    _state_keys = AdsRgbwLight._state_keys | AdsBrightnessLight._state_keys
@@ -122,4 +122,4 @@ class AdsSensor(AdsEntity, SensorEntity):
     @property
     def native_value(self) -> StateType:
         """Return the state of the device."""
-        return self._state_dict[STATE_KEY_STATE]
+        return self._state
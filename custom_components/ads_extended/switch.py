@@ -18,7 +18,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import CONF_ADS_VAR, DATA_ADS, STATE_KEY_STATE
+from .const import ADS_VAR_SCHEMA, CONF_ADS_VAR, DATA_ADS, STATE_KEY_IS_ON
 from .entity import AdsEntity
 
 CONF_ADS_VAR_TURN_ON = "adsvar_turn_on"
@@ -28,9 +28,9 @@ DEFAULT_NAME = "ADS Switch"
 
 PLATFORM_SCHEMA = SWITCH_PLATFORM_SCHEMA.extend(
     {
-        vol.Required(CONF_ADS_VAR): cv.string,
-        vol.Optional(CONF_ADS_VAR_TURN_ON): cv.string,
-        vol.Optional(CONF_ADS_VAR_TURN_OFF): cv.string,
+        vol.Required(CONF_ADS_VAR): ADS_VAR_SCHEMA,
+        vol.Optional(CONF_ADS_VAR_TURN_ON): ADS_VAR_SCHEMA,
+        vol.Optional(CONF_ADS_VAR_TURN_OFF): ADS_VAR_SCHEMA,
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
     }
 )
@@ -56,6 +56,9 @@ def setup_platform(
 class AdsSwitch(AdsEntity, SwitchEntity):
     """Representation of an ADS switch device."""
 
+    _state_keys = frozenset({STATE_KEY_IS_ON})
+    _state_key_available = STATE_KEY_IS_ON
+
     def __init__(
         self,
         ads_hub: AdsHub,
@@ -71,23 +74,40 @@ class AdsSwitch(AdsEntity, SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register device notification."""
-        await self.async_initialize_device(self._ads_var, pyads.PLCTYPE_BOOL)
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the entity is on."""
-        return self._state_dict[STATE_KEY_STATE]
-
-    def turn_on(self, **kwargs: Any) -> None:
+        await self.async_initialize_device(
+            self._ads_var, pyads.PLCTYPE_BOOL, STATE_KEY_IS_ON
+        )
+
+        # Warm up the hub's handle cache for the written variables
+        await self.hass.async_add_executor_job(
+            self._ads_hub.get_handle, self._ads_var_turn_on or self._ads_var
+        )
+        await self.hass.async_add_executor_job(
+            self._ads_hub.get_handle, self._ads_var_turn_off or self._ads_var
+        )
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        if self._ads_var_turn_on is not None:
-            self._ads_hub.write_by_name(self._ads_var_turn_on, True, pyads.PLCTYPE_BOOL)
-        else:
-            self._ads_hub.write_by_name(self._ads_var, True, pyads.PLCTYPE_BOOL)
-
-    def turn_off(self, **kwargs: Any) -> None:
+        await self.hass.async_add_executor_job(
+            self._ads_hub.write_by_handle,
+            self._ads_var_turn_on or self._ads_var,
+            True,
+            pyads.PLCTYPE_BOOL,
+        )
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         if self._ads_var_turn_off is not None:
-            self._ads_hub.write_by_name(self._ads_var_turn_off, True, pyads.PLCTYPE_BOOL)
+            await self.hass.async_add_executor_job(
+                self._ads_hub.write_by_handle,
+                self._ads_var_turn_off,
+                True,
+                pyads.PLCTYPE_BOOL,
+            )
         else:
-            self._ads_hub.write_by_name(self._ads_var, False, pyads.PLCTYPE_BOOL)
\ No newline at end of file
+            await self.hass.async_add_executor_job(
+                self._ads_hub.write_by_handle,
+                self._ads_var,
+                False,
+                pyads.PLCTYPE_BOOL,
+            )